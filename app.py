@@ -12,13 +12,34 @@ Update frequency: 4x daily (00, 06, 12, 18 UTC)
 For BVLOS drone operations assessment.
 """
 
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+import orjson
 import requests
-from datetime import datetime, timezone
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 import logging
+import math
+import os
+import threading
+import time
+
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson (used by jsonify and request.get_json)."""
+    
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app)
 
 logging.basicConfig(level=logging.INFO)
@@ -27,6 +48,26 @@ logger = logging.getLogger(__name__)
 # Environment Canada GeoMet WMS endpoint
 EC_WMS_BASE = "https://geo.weather.gc.ca/geomet"
 
+# Upstream (connect, read) timeout in seconds, and the total time a request
+# handler waits on upstream fetches before reporting layers as unavailable
+UPSTREAM_TIMEOUT = (3, 8)
+REQUEST_BUDGET = 15
+
+# GetFeatureInfo parameters shared by every request; only LAYERS,
+# QUERY_LAYERS and BBOX vary
+WMS_PARAMS_TEMPLATE = {
+    "SERVICE": "WMS",
+    "VERSION": "1.3.0",
+    "REQUEST": "GetFeatureInfo",
+    "INFO_FORMAT": "application/json",
+    "CRS": "EPSG:4326",
+    # A single pixel covering the bbox - the only value we read
+    "WIDTH": "1",
+    "HEIGHT": "1",
+    "I": "0",
+    "J": "0",
+}
+
 # HRDPS layer names - ALL VERIFIED via live API testing on 2026-01-30
 HRDPS_LAYERS = {
     "temperature": "HRDPS.CONTINENTAL_TT",
@@ -39,118 +80,473 @@ HRDPS_LAYERS = {
     "cloud_cover": "HRDPS.CONTINENTAL_TCDC",
 }
 
+MAX_BATCH_POINTS = 50
+
+# Fetch threads (and pooled connections), sized so a full /weather/batch
+# can have every point's combined request in flight at once, and a few
+# points' full per-layer fallback fan-out, without queuing
+FETCH_WORKERS = max(MAX_BATCH_POINTS, len(HRDPS_LAYERS) * 8)
+
+# Shared HTTP session (connection reuse across layer fetches) and a thread
+# pool so the per-layer requests to GeoMet run concurrently
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=FETCH_WORKERS,
+    # Retry connect failures and transient gateway errors; the final response
+    # is still returned (not raised) so callers report it as "HTTP 5xx".
+    # Read timeouts are not retried - they surface as Timeout after one
+    # UPSTREAM_TIMEOUT read instead of three.
+    max_retries=Retry(
+        total=2,
+        read=False,
+        backoff_factor=0.2,
+        status_forcelist=[502, 503, 504],
+        raise_on_status=False,
+    ),
+))
+EXECUTOR = ThreadPoolExecutor(max_workers=FETCH_WORKERS)
+
+# Variables reported by /weather and /weather/batch
+WEATHER_VARIABLES = [
+    "temperature", "wind_speed", "wind_direction", "wind_gust",
+    "precip_accum", "cloud_cover", "specific_humidity",
+]
+
+# /layers never changes at runtime, so serialize it once
+LAYERS_JSON = orjson.dumps({
+    "layers": HRDPS_LAYERS,
+    "note": "Using WMS GetFeatureInfo for data retrieval"
+})
 
-def fetch_layer_wms(layer_id: str, lat: float, lon: float) -> dict:
+# Layer value cache - HRDPS only updates 4x daily, so a fetched value is
+# reused for CACHE_TTL seconds. Uses Redis when REDIS_URL is set, otherwise
+# an in-process LRU (per worker).
+CACHE_TTL = int(os.environ.get('CACHE_TTL', 1800))
+CACHE_MAX_ENTRIES = 4096
+# Decimal places points are rounded to - the unit of caching, request
+# coalescing and conditional-GET revalidation
+COORD_PRECISION = 2
+REDIS_TIMEOUT = 0.5  # seconds, connect and per command
+
+redis_client = None
+if os.environ.get('REDIS_URL'):
+    try:
+        import redis
+        # Short socket timeouts so an unreachable Redis costs a fraction of a
+        # second per lookup instead of eating into REQUEST_BUDGET
+        redis_client = redis.Redis(connection_pool=redis.ConnectionPool.from_url(
+            os.environ['REDIS_URL'],
+            socket_connect_timeout=REDIS_TIMEOUT,
+            socket_timeout=REDIS_TIMEOUT,
+        ))
+    except ImportError:
+        logger.warning("REDIS_URL is set but redis is not installed - using in-process cache")
+
+_local_cache = OrderedDict()  # key -> (expires_at, value)
+_cache_lock = threading.Lock()
+_cache_stats = {"hits": 0, "misses": 0}
+
+
+def cache_key(layer_id: str, lat: float, lon: float) -> str:
+    """Cache key for a layer at a point, rounded to ~1km (below HRDPS grid spacing)."""
+    return f"{layer_id}:{round(lat, COORD_PRECISION)}:{round(lon, COORD_PRECISION)}"
+
+
+def cache_get_many(keys: list) -> list:
+    """Return the cached values for keys (None where missing/expired), in order."""
+    if redis_client is not None:
+        try:
+            return [
+                orjson.loads(cached) if cached is not None else None
+                for cached in redis_client.mget(keys)
+            ]
+        except Exception as e:
+            logger.warning(f"Redis get failed for {len(keys)} keys: {e}")
+            return [None] * len(keys)
+    
+    values = []
+    now = time.monotonic()
+    with _cache_lock:
+        for key in keys:
+            entry = _local_cache.get(key)
+            if entry is not None and entry[0] < now:
+                del _local_cache[key]
+                entry = None
+            if entry is None:
+                values.append(None)
+            else:
+                _local_cache.move_to_end(key)
+                values.append(entry[1])
+    return values
+
+
+def cache_set_many(entries: dict) -> None:
+    """Store each {key: value} for CACHE_TTL seconds."""
+    if not entries:
+        return
+    
+    if redis_client is not None:
+        try:
+            pipe = redis_client.pipeline(transaction=False)
+            for key, value in entries.items():
+                pipe.setex(key, CACHE_TTL, orjson.dumps(value))
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Redis set failed for {len(entries)} keys: {e}")
+        return
+    
+    expires_at = time.monotonic() + CACHE_TTL
+    with _cache_lock:
+        for key, value in entries.items():
+            _local_cache[key] = (expires_at, value)
+            _local_cache.move_to_end(key)
+        while len(_local_cache) > CACHE_MAX_ENTRIES:
+            _local_cache.popitem(last=False)
+
+
+def record_cache_lookup(key: str, hit: bool) -> None:
+    """Update hit/miss counters and log the lookup."""
+    with _cache_lock:
+        _cache_stats["hits" if hit else "misses"] += 1
+        hits, misses = _cache_stats["hits"], _cache_stats["misses"]
+    logger.info(f"Cache {'hit' if hit else 'miss'} {key} (hits={hits}, misses={misses})")
+
+
+# Upstream fetches in progress, so concurrent identical cache misses
+# share one request instead of each hitting GeoMet
+_inflight = {}  # key -> Future for the fetch in progress
+_inflight_lock = threading.Lock()
+
+
+def singleflight(key: str, func, *args):
+    """
+    Call func(*args), or if a call with the same key is already running,
+    wait for it and return (or raise) its result instead.
+    
+    Keys must be unique per func - callers prefix them (e.g. "layer:") so
+    calls returning different shapes never share a result.
+    """
+    with _inflight_lock:
+        future = _inflight.get(key)
+        leader = future is None
+        if leader:
+            future = Future()
+            _inflight[key] = future
+    
+    if not leader:
+        return future.result()
+    
+    try:
+        result = func(*args)
+        future.set_result(result)
+        return result
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+
+
+def wms_bbox(lat: float, lon: float) -> str:
+    """
+    Small GetFeatureInfo bounding box (lat/lon order for EPSG:4326) around a
+    point rounded like cache_key(), so points sharing a cache entry also send
+    identical requests (and share conditional-GET validators).
+    """
+    lat = round(lat, COORD_PRECISION)
+    lon = round(lon, COORD_PRECISION)
+    buffer = 0.01  # ~1km, still covers the unrounded point
+    return f"{lat - buffer},{lon - buffer},{lat + buffer},{lon + buffer}"
+
+
+def wms_params(layers: str, bbox: str) -> dict:
+    """Build GetFeatureInfo query parameters for one or more comma-separated layers."""
+    params = WMS_PARAMS_TEMPLATE.copy()
+    params["LAYERS"] = params["QUERY_LAYERS"] = layers
+    params["BBOX"] = bbox
+    return params
+
+
+def feature_value(feature: dict):
+    """Extract the raw value from a GetFeatureInfo GeoJSON feature."""
+    props = feature.get("properties", {})
+    # The value key varies - try common ones (0 is a real value, e.g. no precip)
+    for key in ("value", "GRAY_INDEX", "Band1"):
+        if props.get(key) is not None:
+            return props[key]
+    return None
+
+
+# Circuit breaker - layers that just failed are skipped for a short while
+# instead of waiting on the same upstream timeout again
+BAD_LAYER_COOLDOWN = 60  # seconds
+_bad_layers = {}  # layer_id -> time.monotonic() until which it is skipped
+
+
+def mark_layer_failed(layer_id: str) -> None:
+    """Skip layer_id for BAD_LAYER_COOLDOWN seconds."""
+    _bad_layers[layer_id] = time.monotonic() + BAD_LAYER_COOLDOWN
+
+
+def layer_in_cooldown(layer_id: str) -> bool:
+    """True if layer_id failed recently and should not be requested."""
+    return _bad_layers.get(layer_id, 0) > time.monotonic()
+
+
+def skipped_layer(layer_id: str) -> dict:
+    """Result for a layer skipped by the circuit breaker."""
+    return {
+        "value": None,
+        "status": "error",
+        "error": "Skipped after a recent upstream failure",
+        "layer": layer_id,
+    }
+
+
+# Validators from previous GeoMet responses, for conditional GETs
+_validators = OrderedDict()  # request key -> (etag, last_modified, data)
+_validators_lock = threading.Lock()
+
+
+def wms_get(params: dict):
+    """
+    GET a GetFeatureInfo response from GeoMet.
+    
+    Repeats of an earlier request send If-None-Match/If-Modified-Since, and a
+    304 reuses the earlier body. Returns (status_code, data) where data is
+    the parsed JSON body, or None if the status isn't 200.
+    """
+    key = f"{params['LAYERS']}:{params['BBOX']}"
+    with _validators_lock:
+        validator = _validators.get(key)
+    
+    headers = {}
+    if validator is not None:
+        etag, last_modified, _ = validator
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+    
+    response = SESSION.get(EC_WMS_BASE, params=params, headers=headers, timeout=UPSTREAM_TIMEOUT)
+    
+    if response.status_code == 304 and validator is not None:
+        logger.info(f"Not modified: {params['LAYERS']}")
+        return 200, validator[2]
+    if response.status_code != 200:
+        return response.status_code, None
+    
+    data = orjson.loads(response.content)
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag or last_modified:
+        with _validators_lock:
+            _validators[key] = (etag, last_modified, data)
+            _validators.move_to_end(key)
+            while len(_validators) > CACHE_MAX_ENTRIES:
+                _validators.popitem(last=False)
+    return 200, data
+
+
+def fetch_layer_wms(layer_id: str, lat: float, lon: float, bbox: str = None) -> dict:
     """
     Fetch a single layer value using WMS GetFeatureInfo.
     This returns JSON directly - no NetCDF parsing needed.
+    
+    Not cached - fetch_all_layers_wms handles caching for its fallbacks.
+    bbox can be passed in when the caller already built it with wms_bbox().
     """
-    # Build a small bounding box around the point
-    buffer = 0.01  # ~1km
-    min_lon = lon - buffer
-    max_lon = lon + buffer
-    min_lat = lat - buffer
-    max_lat = lat + buffer
-    
-    params = {
-        "SERVICE": "WMS",
-        "VERSION": "1.3.0",
-        "REQUEST": "GetFeatureInfo",
-        "LAYERS": layer_id,
-        "QUERY_LAYERS": layer_id,
-        "INFO_FORMAT": "application/json",
-        "CRS": "EPSG:4326",
-        "BBOX": f"{min_lat},{min_lon},{max_lat},{max_lon}",
-        "WIDTH": "3",
-        "HEIGHT": "3",
-        "I": "1",  # Center pixel
-        "J": "1",  # Center pixel
-    }
+    if layer_in_cooldown(layer_id):
+        return skipped_layer(layer_id)
+    
+    params = wms_params(layer_id, bbox or wms_bbox(lat, lon))
     
     try:
-        response = requests.get(EC_WMS_BASE, params=params, timeout=30)
-        logger.info(f"Fetching {layer_id}: {response.status_code}")
+        status_code, data = wms_get(params)
+        logger.info(f"Fetching {layer_id}: {status_code}")
         
-        if response.status_code != 200:
-            return {"value": None, "status": "error", "error": f"HTTP {response.status_code}"}
+        if status_code != 200:
+            mark_layer_failed(layer_id)
+            return {"value": None, "status": "error", "error": f"HTTP {status_code}"}
         
-        data = response.json()
+        _bad_layers.pop(layer_id, None)
         
         # Extract value from GeoJSON response
         if "features" in data and len(data["features"]) > 0:
-            props = data["features"][0].get("properties", {})
-            # The value key varies - try common ones
-            value = props.get("value") or props.get("GRAY_INDEX") or props.get("Band1")
+            value = feature_value(data["features"][0])
             if value is not None:
                 return {"value": float(value), "status": "success", "layer": layer_id}
         
         return {"value": None, "status": "no_data", "layer": layer_id}
         
     except requests.exceptions.Timeout:
+        mark_layer_failed(layer_id)
         return {"value": None, "status": "timeout", "layer": layer_id}
     except Exception as e:
         logger.warning(f"Error fetching {layer_id}: {e}")
+        mark_layer_failed(layer_id)
         return {"value": None, "status": "error", "error": str(e), "layer": layer_id}
 
 
-def mps_to_knots(mps: float) -> float:
-    """Convert meters per second to knots."""
-    return mps * 1.94384
-
-
-@app.route('/health', methods=['GET'])
-def health_check():
-    """Health check endpoint."""
-    return jsonify({
-        "status": "healthy",
-        "service": "Environment Canada HRDPS Weather API",
-        "timestamp": datetime.now(timezone.utc).isoformat()
-    })
+def time_left(deadline: float = None):
+    """Seconds remaining until a time.monotonic() deadline (None = no limit)."""
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
 
 
-@app.route('/weather', methods=['GET'])
-def get_weather():
+def fetch_all_layers_wms(lat: float, lon: float, variables: list = None,
+                         deadline: float = None) -> dict:
     """
-    Get HRDPS weather forecast for a specific location.
+    Fetch several HRDPS variables for one point with a single GetFeatureInfo
+    request (comma-separated LAYERS/QUERY_LAYERS).
     
-    Query Parameters:
-        lat: Latitude (required, decimal degrees)
-        lon: Longitude (required, decimal degrees)
+    Cached layers are not re-requested. Layers the combined response doesn't
+    return a named feature for fall back to their own requests, run in parallel.
+    Layers still outstanding at deadline (a time.monotonic() value) are
+    reported as timed out.
+    Returns {variable_name: result} in the same shape as fetch_layer_wms.
     """
-    try:
-        lat = float(request.args.get('lat'))
-        lon = float(request.args.get('lon'))
-    except (TypeError, ValueError):
-        return jsonify({"error": "Missing or invalid lat/lon parameters"}), 400
+    if variables is None:
+        variables = list(HRDPS_LAYERS)
     
-    # Validate coordinates for HRDPS coverage
-    if not (40 <= lat <= 85 and -145 <= lon <= -50):
-        return jsonify({
-            "error": "Coordinates outside HRDPS coverage area",
-            "coverage": "Approximately 40°N to 85°N, 145°W to 50°W"
-        }), 400
+    results = {}
+    pending = {}  # layer_id -> variable name
+    keys = [cache_key(HRDPS_LAYERS[var_name], lat, lon) for var_name in variables]
+    for var_name, key, cached in zip(variables, keys, cache_get_many(keys)):
+        layer_id = HRDPS_LAYERS[var_name]
+        record_cache_lookup(key, cached is not None)
+        if cached is not None:
+            results[var_name] = cached
+        elif layer_in_cooldown(layer_id):
+            results[var_name] = skipped_layer(layer_id)
+        else:
+            pending[layer_id] = var_name
     
-    logger.info(f"Fetching weather for lat={lat}, lon={lon}")
+    if not pending:
+        return results
     
-    results = {
-        "location": {"lat": lat, "lon": lon},
-        "data_source": "Environment Canada HRDPS",
-        "resolution_km": 2.5,
-        "forecast_hours": 48,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+    if time_left(deadline) == 0:
+        for layer_id, var_name in pending.items():
+            results[var_name] = {"value": None, "status": "timeout", "layer": layer_id}
+        return results
+    
+    bbox = wms_bbox(lat, lon)
+    params = wms_params(",".join(pending), bbox)
+    
+    try:
+        # Run on the pool so the wait can be cut off at the deadline
+        combined_key = f"combined:{cache_key(params['LAYERS'], lat, lon)}"
+        status_code, data = EXECUTOR.submit(
+            singleflight, combined_key, wms_get, params
+        ).result(timeout=time_left(deadline))
+        logger.info(f"Fetching {len(pending)} layers: {status_code}")
+        
+        if status_code == 200:
+            for layer_id in pending:
+                _bad_layers.pop(layer_id, None)
+            # Only trust features that name their layer - the server's
+            # feature order need not follow LAYERS, and a wrong match would
+            # report (and cache) one variable's value as another's
+            fetched = {}
+            for feature in data.get("features") or []:
+                layer_id = feature.get("properties", {}).get("layer") or feature.get("id")
+                if layer_id not in pending:
+                    continue
+                value = feature_value(feature)
+                if value is not None:
+                    result = {"value": float(value), "status": "success", "layer": layer_id}
+                    results[pending.pop(layer_id)] = result
+                    fetched[cache_key(layer_id, lat, lon)] = result
+            cache_set_many(fetched)
+        
+    except FuturesTimeoutError:
+        # Our own request budget ran out - not an upstream failure, so the
+        # layers are reported as timed out without tripping the breaker
+        for layer_id, var_name in pending.items():
+            results[var_name] = {"value": None, "status": "timeout", "layer": layer_id}
+        return results
+    # Don't retry layer-by-layer against an upstream that is hanging or unreachable
+    except requests.exceptions.Timeout:
+        for layer_id, var_name in pending.items():
+            mark_layer_failed(layer_id)
+            results[var_name] = {"value": None, "status": "timeout", "layer": layer_id}
+        return results
+    except requests.exceptions.ConnectionError as e:
+        logger.warning(f"Error fetching combined layers: {e}")
+        for layer_id, var_name in pending.items():
+            mark_layer_failed(layer_id)
+            results[var_name] = {"value": None, "status": "error", "error": str(e), "layer": layer_id}
+        return results
+    except Exception as e:
+        logger.warning(f"Error fetching combined layers: {e}")
+    
+    # Fall back to one request per remaining layer
+    futures = {
+        layer_id: EXECUTOR.submit(
+            singleflight, f"layer:{cache_key(layer_id, lat, lon)}",
+            fetch_layer_wms, layer_id, lat, lon, bbox,
+        )
+        for layer_id in pending
     }
+    fetched = {}
+    for layer_id, future in futures.items():
+        try:
+            result = future.result(timeout=time_left(deadline))
+        except FuturesTimeoutError:
+            future.cancel()
+            result = {"value": None, "status": "timeout", "layer": layer_id}
+        results[pending[layer_id]] = result
+        if result.get("status") == "success":
+            fetched[cache_key(layer_id, lat, lon)] = result
+    cache_set_many(fetched)
     
+    return results
+
+
+_timestamp_cache = (0, "")  # (unix second, formatted timestamp)
+
+
+def utc_timestamp() -> str:
+    """Current UTC time as ISO 8601 with second precision, formatted once per second."""
+    global _timestamp_cache
+    now = int(time.time())
+    second, formatted = _timestamp_cache
+    if second != now:
+        formatted = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now))
+        _timestamp_cache = (now, formatted)
+    return formatted
+
+
+def in_hrdps_coverage(lat: float, lon: float) -> bool:
+    """Check that a point falls inside the HRDPS domain (NaN/inf are rejected)."""
+    return (
+        math.isfinite(lat) and math.isfinite(lon)
+        and 40.0 <= lat <= 85.0 and -145.0 <= lon <= -50.0
+    )
+
+
+def mps_to_knots(mps: float) -> float:
+    """Convert meters per second to knots."""
+    return mps * 1.94384
+
+
+def summarize_weather(layers: dict) -> dict:
+    """Convert fetched WEATHER_VARIABLES layers into /weather response fields."""
+    results = {}
     errors = []
     
-    # Fetch temperature
-    temp_result = fetch_layer_wms(HRDPS_LAYERS["temperature"], lat, lon)
+    # Temperature
+    temp_result = layers["temperature"]
     if temp_result.get("status") == "success":
         results["temperature_c"] = round(temp_result["value"], 1)
     else:
         errors.append("temperature")
     
-    # Fetch wind speed
-    wind_result = fetch_layer_wms(HRDPS_LAYERS["wind_speed"], lat, lon)
+    # Wind speed
+    wind_result = layers["wind_speed"]
     if wind_result.get("status") == "success":
         speed_mps = wind_result["value"]
         results["wind_speed_mps"] = round(speed_mps, 1)
@@ -158,15 +554,15 @@ def get_weather():
     else:
         errors.append("wind_speed")
     
-    # Fetch wind direction
-    dir_result = fetch_layer_wms(HRDPS_LAYERS["wind_direction"], lat, lon)
+    # Wind direction
+    dir_result = layers["wind_direction"]
     if dir_result.get("status") == "success":
         results["wind_direction_deg"] = round(dir_result["value"])
     else:
         errors.append("wind_direction")
     
-    # Fetch wind gusts
-    gust_result = fetch_layer_wms(HRDPS_LAYERS["wind_gust"], lat, lon)
+    # Wind gusts
+    gust_result = layers["wind_gust"]
     if gust_result.get("status") == "success":
         gust_mps = gust_result["value"]
         results["wind_gust_mps"] = round(gust_mps, 1)
@@ -174,22 +570,22 @@ def get_weather():
     else:
         errors.append("wind_gust")
     
-    # Fetch precipitation
-    precip_result = fetch_layer_wms(HRDPS_LAYERS["precip_accum"], lat, lon)
+    # Precipitation
+    precip_result = layers["precip_accum"]
     if precip_result.get("status") == "success":
         results["precipitation_mm"] = round(precip_result["value"], 2)
     else:
         errors.append("precipitation")
     
-    # Fetch cloud cover
-    cloud_result = fetch_layer_wms(HRDPS_LAYERS["cloud_cover"], lat, lon)
+    # Cloud cover
+    cloud_result = layers["cloud_cover"]
     if cloud_result.get("status") == "success":
         results["cloud_cover_pct"] = round(cloud_result["value"])
     else:
         errors.append("cloud_cover")
     
-    # Fetch humidity
-    humidity_result = fetch_layer_wms(HRDPS_LAYERS["specific_humidity"], lat, lon)
+    # Humidity
+    humidity_result = layers["specific_humidity"]
     if humidity_result.get("status") == "success":
         results["specific_humidity_kgkg"] = round(humidity_result["value"], 6)
     else:
@@ -198,9 +594,116 @@ def get_weather():
     if errors:
         results["unavailable_data"] = errors
     
+    return results
+
+
+@app.route('/health', methods=['GET'])
+def health_check():
+    """Health check endpoint."""
+    body = orjson.dumps({
+        "status": "healthy",
+        "service": "Environment Canada HRDPS Weather API",
+        "timestamp": utc_timestamp()
+    })
+    return Response(body, mimetype="application/json")
+
+
+@app.route('/weather', methods=['GET'])
+def get_weather():
+    """
+    Get HRDPS weather forecast for a specific location.
+    
+    Query Parameters:
+        lat: Latitude (required, decimal degrees)
+        lon: Longitude (required, decimal degrees)
+    """
+    try:
+        lat = float(request.args.get('lat'))
+        lon = float(request.args.get('lon'))
+    except (TypeError, ValueError):
+        return jsonify({"error": "Missing or invalid lat/lon parameters"}), 400
+    
+    # Validate coordinates for HRDPS coverage
+    if not in_hrdps_coverage(lat, lon):
+        return jsonify({
+            "error": "Coordinates outside HRDPS coverage area",
+            "coverage": "Approximately 40°N to 85°N, 145°W to 50°W"
+        }), 400
+    
+    logger.info(f"Fetching weather for lat={lat}, lon={lon}")
+    
+    results = {
+        "location": {"lat": lat, "lon": lon},
+        "data_source": "Environment Canada HRDPS",
+        "resolution_km": 2.5,
+        "forecast_hours": 48,
+        "timestamp": utc_timestamp(),
+    }
+    
+    deadline = time.monotonic() + REQUEST_BUDGET
+    layers = fetch_all_layers_wms(lat, lon, WEATHER_VARIABLES, deadline)
+    results.update(summarize_weather(layers))
+    
     return jsonify(results)
 
 
+@app.route('/weather/batch', methods=['POST'])
+def get_weather_batch():
+    """
+    Get HRDPS weather forecast for several locations (e.g. waypoints on a route).
+    
+    JSON Body:
+        points: List of {"lat": ..., "lon": ...} objects (max 50).
+                A bare list is also accepted.
+    """
+    body = request.get_json(silent=True)
+    points = body.get("points") if isinstance(body, dict) else body
+    if not isinstance(points, list) or not points:
+        return jsonify({"error": "Body must be a JSON list of {lat, lon} points"}), 400
+    if len(points) > MAX_BATCH_POINTS:
+        return jsonify({"error": f"At most {MAX_BATCH_POINTS} points per request"}), 400
+    
+    coords = []
+    for index, point in enumerate(points):
+        try:
+            lat = float(point["lat"])
+            lon = float(point["lon"])
+        except (TypeError, ValueError, KeyError):
+            return jsonify({"error": f"Missing or invalid lat/lon for point {index}"}), 400
+        if not in_hrdps_coverage(lat, lon):
+            return jsonify({
+                "error": f"Point {index} outside HRDPS coverage area",
+                "coverage": "Approximately 40°N to 85°N, 145°W to 50°W"
+            }), 400
+        coords.append((lat, lon))
+    
+    logger.info(f"Fetching weather for {len(coords)} points")
+    
+    # One thread per point, owned by this request, so no point waits behind
+    # another batch's points while the deadline runs. Point threads only
+    # wait on EXECUTOR, which never waits on them, so this can't deadlock.
+    deadline = time.monotonic() + REQUEST_BUDGET
+    with ThreadPoolExecutor(max_workers=len(coords)) as point_pool:
+        futures = [
+            point_pool.submit(fetch_all_layers_wms, lat, lon, WEATHER_VARIABLES, deadline)
+            for lat, lon in coords
+        ]
+        
+        point_results = []
+        for (lat, lon), future in zip(coords, futures):
+            point = {"location": {"lat": lat, "lon": lon}}
+            point.update(summarize_weather(future.result()))
+            point_results.append(point)
+    
+    return jsonify({
+        "data_source": "Environment Canada HRDPS",
+        "resolution_km": 2.5,
+        "forecast_hours": 48,
+        "timestamp": utc_timestamp(),
+        "points": point_results,
+    })
+
+
 @app.route('/bvlos-assessment', methods=['GET'])
 def bvlos_assessment():
     """
@@ -226,7 +729,11 @@ def bvlos_assessment():
     except (TypeError, ValueError):
         return jsonify({"error": "Invalid parameters"}), 400
     
-    if not (40 <= lat <= 85 and -145 <= lon <= -50):
+    # A NaN threshold would make every comparison False and report GREEN
+    if not all(map(math.isfinite, (max_wind, max_gust, max_precip, min_temp, max_temp))):
+        return jsonify({"error": "Invalid parameters"}), 400
+    
+    if not in_hrdps_coverage(lat, lon):
         return jsonify({"error": "Coordinates outside HRDPS coverage"}), 400
     
     results = {
@@ -238,15 +745,20 @@ def bvlos_assessment():
             "min_temp_c": min_temp,
             "max_temp_c": max_temp
         },
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": utc_timestamp(),
         "data_source": "Environment Canada HRDPS (2.5km resolution)",
     }
     
     conditions = {}
     issues = []
     
+    deadline = time.monotonic() + REQUEST_BUDGET
+    layers = fetch_all_layers_wms(
+        lat, lon, ["wind_speed", "wind_gust", "temperature", "precip_accum"], deadline
+    )
+    
     # Check wind speed
-    wind_result = fetch_layer_wms(HRDPS_LAYERS["wind_speed"], lat, lon)
+    wind_result = layers["wind_speed"]
     if wind_result.get("status") == "success":
         speed_kts = mps_to_knots(wind_result["value"])
         conditions["wind_speed_kts"] = round(speed_kts, 1)
@@ -256,7 +768,7 @@ def bvlos_assessment():
         issues.append("Wind speed data unavailable")
     
     # Check gusts
-    gust_result = fetch_layer_wms(HRDPS_LAYERS["wind_gust"], lat, lon)
+    gust_result = layers["wind_gust"]
     if gust_result.get("status") == "success":
         gust_kts = mps_to_knots(gust_result["value"])
         conditions["wind_gust_kts"] = round(gust_kts, 1)
@@ -266,7 +778,7 @@ def bvlos_assessment():
         conditions["wind_gust_kts"] = None
     
     # Check temperature
-    temp_result = fetch_layer_wms(HRDPS_LAYERS["temperature"], lat, lon)
+    temp_result = layers["temperature"]
     if temp_result.get("status") == "success":
         temp_c = temp_result["value"]
         conditions["temperature_c"] = round(temp_c, 1)
@@ -276,7 +788,7 @@ def bvlos_assessment():
             issues.append(f"Temperature {temp_c:.1f}°C exceeds {max_temp}°C maximum")
     
     # Check precipitation
-    precip_result = fetch_layer_wms(HRDPS_LAYERS["precip_accum"], lat, lon)
+    precip_result = layers["precip_accum"]
     if precip_result.get("status") == "success":
         precip_mm = precip_result["value"]
         conditions["precipitation_mm"] = round(precip_mm, 2)
@@ -308,13 +820,11 @@ def bvlos_assessment():
 @app.route('/layers', methods=['GET'])
 def list_layers():
     """List available HRDPS layers."""
-    return jsonify({
-        "layers": HRDPS_LAYERS,
-        "note": "Using WMS GetFeatureInfo for data retrieval"
-    })
+    return Response(LAYERS_JSON, mimetype="application/json")
 
 
 if __name__ == '__main__':
-    import os
+    # Local development only - production runs under gunicorn:
+    #   gunicorn -c gunicorn.conf.py app:app
     port = int(os.environ.get('PORT', 8080))
-    app.run(host='0.0.0.0', port=port, debug=True)
+    app.run(host='0.0.0.0', port=port, debug=os.environ.get('FLASK_DEBUG') == '1')
@@ -0,0 +1,38 @@
+"""Shared pytest fixtures for the HRDPS Weather API."""
+
+import pytest
+
+import app as weather_app
+
+
+@pytest.fixture(autouse=True)
+def reset_state():
+    """Clear module-level caches, breaker and in-flight state between tests."""
+    weather_app._local_cache.clear()
+    weather_app._bad_layers.clear()
+    weather_app._validators.clear()
+    weather_app._inflight.clear()
+    yield
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """
+    Replace SESSION.get with a handler. Tests set upstream.handler to a
+    function (params) -> FakeResponse; every call's LAYERS is recorded in
+    upstream.calls and its request headers in upstream.headers.
+    """
+    class Upstream:
+        calls = []
+        headers = []
+        handler = None
+    
+    def fake_get(url, params=None, headers=None, timeout=None):
+        Upstream.calls.append(params["LAYERS"])
+        Upstream.headers.append(headers or {})
+        return Upstream.handler(params)
+    
+    Upstream.calls = []
+    Upstream.headers = []
+    monkeypatch.setattr(weather_app.SESSION, "get", fake_get)
+    return Upstream
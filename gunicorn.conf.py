@@ -0,0 +1,21 @@
+"""
+Gunicorn configuration for the HRDPS Weather API.
+
+gevent workers keep serving other clients while a request waits on
+Environment Canada, instead of blocking the whole worker. The gevent
+worker monkey-patches itself before importing app.py (no preload_app),
+so requests and the fetch thread pools in app.py are cooperative.
+
+    gunicorn -c gunicorn.conf.py app:app
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 8080)}"
+worker_class = "gevent"
+# Concurrency comes from gevent, not process count, and each worker keeps its
+# own in-process cache and breaker - so a few workers, not the sync 2N+1 rule
+# (which would also count host CPUs rather than the container's limit)
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))
+worker_connections = 1000
+timeout = 120
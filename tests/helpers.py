@@ -0,0 +1,20 @@
+"""Test doubles for GeoMet GetFeatureInfo responses."""
+
+import orjson
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response as used by wms_get."""
+    
+    def __init__(self, status_code=200, body=None, headers=None):
+        self.status_code = status_code
+        self.content = orjson.dumps(body if body is not None else {})
+        self.headers = headers or {}
+
+
+def named_features(values: dict) -> dict:
+    """GetFeatureInfo body with one named feature per {layer_id: value}."""
+    return {"features": [
+        {"id": layer_id, "properties": {"value": value}}
+        for layer_id, value in values.items()
+    ]}
@@ -0,0 +1,57 @@
+import time
+
+import app as weather_app
+from helpers import FakeResponse, named_features
+
+
+def all_layers_handler(delay=0.0):
+    """Healthy upstream: every requested layer gets a named value after delay."""
+    def handler(params):
+        time.sleep(delay)
+        return FakeResponse(body=named_features({
+            layer_id: 1.0 for layer_id in params["LAYERS"].split(",")
+        }))
+    return handler
+
+
+def test_batch_returns_one_entry_per_point_in_order(upstream):
+    upstream.handler = all_layers_handler()
+    points = [{"lat": 46.3, "lon": -79.5}, {"lat": 50.0, "lon": -100.0}]
+    
+    response = weather_app.app.test_client().post("/weather/batch", json={"points": points})
+    
+    assert response.status_code == 200
+    body = response.get_json()
+    assert [p["location"] for p in body["points"]] == points
+    assert all("unavailable_data" not in p for p in body["points"])
+
+
+def test_large_batch_against_slow_upstream_completes(upstream, monkeypatch):
+    # Every point is fetched concurrently, so a healthy upstream answering
+    # in 0.2 s fits well inside the budget however many points there are
+    monkeypatch.setattr(weather_app, "REQUEST_BUDGET", 1.0)
+    upstream.handler = all_layers_handler(delay=0.2)
+    points = [{"lat": 46.0 + i * 0.1, "lon": -79.5} for i in range(weather_app.MAX_BATCH_POINTS)]
+    
+    response = weather_app.app.test_client().post("/weather/batch", json=points)
+    
+    body = response.get_json()
+    assert len(body["points"]) == len(points)
+    assert [p for p in body["points"] if "unavailable_data" in p] == []
+
+
+def test_batch_rejects_too_many_points():
+    points = [{"lat": 46.3, "lon": -79.5}] * (weather_app.MAX_BATCH_POINTS + 1)
+    
+    response = weather_app.app.test_client().post("/weather/batch", json=points)
+    
+    assert response.status_code == 400
+
+
+def test_batch_rejects_invalid_point():
+    points = [{"lat": 46.3, "lon": -79.5}, {"lat": "north"}]
+    
+    response = weather_app.app.test_client().post("/weather/batch", json=points)
+    
+    assert response.status_code == 400
+    assert "point 1" in response.get_json()["error"]
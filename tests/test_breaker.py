@@ -0,0 +1,40 @@
+import time
+
+import requests
+
+import app as weather_app
+from helpers import FakeResponse, named_features
+
+TT = weather_app.HRDPS_LAYERS["temperature"]
+
+
+def test_upstream_timeout_skips_layer_on_next_request(upstream):
+    def handler(params):
+        raise requests.exceptions.Timeout()
+    
+    upstream.handler = handler
+    first = weather_app.fetch_all_layers_wms(46.3, -79.5, ["temperature"])
+    second = weather_app.fetch_all_layers_wms(50.0, -100.0, ["temperature"])
+    
+    assert first["temperature"]["status"] == "timeout"
+    assert second["temperature"]["status"] == "error"
+    assert len(upstream.calls) == 1
+
+
+def test_upstream_error_status_trips_breaker_for_fallback_layer(upstream):
+    upstream.handler = lambda params: FakeResponse(503)
+    
+    results = weather_app.fetch_all_layers_wms(46.3, -79.5, ["temperature"])
+    
+    assert results["temperature"]["status"] == "error"
+    assert weather_app.layer_in_cooldown(TT)
+
+
+def test_success_clears_cooldown(upstream):
+    weather_app.mark_layer_failed(TT)
+    weather_app._bad_layers[TT] = time.monotonic() - 1  # cooldown elapsed
+    upstream.handler = lambda params: FakeResponse(body=named_features({TT: 1.0}))
+    
+    weather_app.fetch_all_layers_wms(46.3, -79.5, ["temperature"])
+    
+    assert TT not in weather_app._bad_layers
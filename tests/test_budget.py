@@ -0,0 +1,37 @@
+import time
+
+import app as weather_app
+from helpers import FakeResponse, named_features
+
+TT = weather_app.HRDPS_LAYERS["temperature"]
+
+
+def test_request_budget_expiry_does_not_trip_breaker(upstream):
+    def handler(params):
+        time.sleep(0.3)
+        return FakeResponse(body=named_features({TT: 1.0}))
+    
+    upstream.handler = handler
+    results = weather_app.fetch_all_layers_wms(
+        46.3, -79.5, ["temperature"], deadline=time.monotonic() + 0.05
+    )
+    
+    assert results["temperature"]["status"] == "timeout"
+    assert not weather_app.layer_in_cooldown(TT)
+
+
+def test_weather_returns_within_budget_when_upstream_hangs(upstream, monkeypatch):
+    def handler(params):
+        time.sleep(1.0)
+        return FakeResponse(body=named_features({}))
+    
+    upstream.handler = handler
+    monkeypatch.setattr(weather_app, "REQUEST_BUDGET", 0.2)
+    
+    start = time.monotonic()
+    response = weather_app.app.test_client().get("/weather?lat=46.3&lon=-79.5")
+    elapsed = time.monotonic() - start
+    
+    assert response.status_code == 200
+    assert "temperature" in response.get_json()["unavailable_data"]
+    assert elapsed < 0.8
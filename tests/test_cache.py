@@ -0,0 +1,90 @@
+import app as weather_app
+from helpers import FakeResponse, named_features
+
+TT = weather_app.HRDPS_LAYERS["temperature"]
+WSPD = weather_app.HRDPS_LAYERS["wind_speed"]
+
+
+class FakeRedis:
+    """Records MGET/SETEX traffic; values live in a plain dict."""
+    
+    def __init__(self, fail=False):
+        self.store = {}
+        self.mget_calls = []
+        self.setex_batches = []
+        self.fail = fail
+    
+    def mget(self, keys):
+        self.mget_calls.append(list(keys))
+        if self.fail:
+            raise ConnectionError("redis down")
+        return [self.store.get(key) for key in keys]
+    
+    def pipeline(self, transaction=True):
+        redis = self
+        batch = []
+        
+        class Pipeline:
+            def setex(self, key, ttl, value):
+                batch.append(key)
+                redis.store[key] = value
+            
+            def execute(self):
+                redis.setex_batches.append(list(batch))
+        
+        return Pipeline()
+
+
+def test_cache_round_trip_and_expiry(monkeypatch):
+    key = weather_app.cache_key(TT, 46.301, -79.499)
+    assert key == weather_app.cache_key(TT, 46.3, -79.5)
+    
+    weather_app.cache_set_many({key: {"value": 1.0, "status": "success"}})
+    assert weather_app.cache_get_many([key]) == [{"value": 1.0, "status": "success"}]
+    
+    monkeypatch.setattr(weather_app, "CACHE_TTL", -1)
+    weather_app.cache_set_many({key: {"value": 2.0, "status": "success"}})
+    assert weather_app.cache_get_many([key]) == [None]
+
+
+def test_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(weather_app, "CACHE_MAX_ENTRIES", 2)
+    weather_app.cache_set_many({"a": {"value": 1}, "b": {"value": 2}})
+    weather_app.cache_get_many(["a"])
+    weather_app.cache_set_many({"c": {"value": 3}})
+    
+    assert weather_app.cache_get_many(["a", "b", "c"]) == [{"value": 1}, None, {"value": 3}]
+
+
+def test_second_request_is_served_from_cache(upstream):
+    upstream.handler = lambda params: FakeResponse(body=named_features({TT: -5.0, WSPD: 4.0}))
+    
+    first = weather_app.fetch_all_layers_wms(46.3, -79.5, ["temperature", "wind_speed"])
+    second = weather_app.fetch_all_layers_wms(46.3, -79.5, ["temperature", "wind_speed"])
+    
+    assert first == second
+    assert len(upstream.calls) == 1
+
+
+def test_redis_lookups_and_writes_are_batched(upstream, monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr(weather_app, "redis_client", redis)
+    upstream.handler = lambda params: FakeResponse(body=named_features({TT: -5.0, WSPD: 4.0}))
+    
+    weather_app.fetch_all_layers_wms(46.3, -79.5, ["temperature", "wind_speed"])
+    second = weather_app.fetch_all_layers_wms(46.3, -79.5, ["temperature", "wind_speed"])
+    
+    assert len(redis.mget_calls) == 2
+    assert len(redis.mget_calls[0]) == 2
+    assert len(redis.setex_batches) == 1
+    assert second["temperature"]["value"] == -5.0
+    assert len(upstream.calls) == 1
+
+
+def test_unreachable_redis_falls_through_to_upstream(upstream, monkeypatch):
+    monkeypatch.setattr(weather_app, "redis_client", FakeRedis(fail=True))
+    upstream.handler = lambda params: FakeResponse(body=named_features({TT: -5.0}))
+    
+    results = weather_app.fetch_all_layers_wms(46.3, -79.5, ["temperature"])
+    
+    assert results["temperature"]["value"] == -5.0
@@ -0,0 +1,43 @@
+import app as weather_app
+from helpers import FakeResponse, named_features
+
+TT = weather_app.HRDPS_LAYERS["temperature"]
+WSPD = weather_app.HRDPS_LAYERS["wind_speed"]
+PR = weather_app.HRDPS_LAYERS["precip_accum"]
+
+
+def test_named_features_are_fetched_in_one_request(upstream):
+    upstream.handler = lambda params: FakeResponse(body=named_features({WSPD: 4.0, TT: -5.0}))
+    
+    results = weather_app.fetch_all_layers_wms(46.3, -79.5, ["temperature", "wind_speed"])
+    
+    assert results["temperature"]["value"] == -5.0
+    assert results["wind_speed"]["value"] == 4.0
+    assert upstream.calls == [f"{TT},{WSPD}"]
+
+
+def test_unnamed_features_fall_back_to_per_layer_requests(upstream):
+    def handler(params):
+        layers = params["LAYERS"].split(",")
+        if len(layers) > 1:
+            # Right count, but no layer names - must not be matched by position
+            return FakeResponse(body={"features": [
+                {"properties": {"value": 99.0}} for _ in layers
+            ]})
+        return FakeResponse(body=named_features({layers[0]: {TT: 1.0, WSPD: 2.0}[layers[0]]}))
+    
+    upstream.handler = handler
+    results = weather_app.fetch_all_layers_wms(46.3, -79.5, ["temperature", "wind_speed"])
+    
+    assert results["temperature"]["value"] == 1.0
+    assert results["wind_speed"]["value"] == 2.0
+    assert len(upstream.calls) == 3
+
+
+def test_zero_value_is_a_value(upstream):
+    upstream.handler = lambda params: FakeResponse(body=named_features({PR: 0}))
+    
+    results = weather_app.fetch_all_layers_wms(46.3, -79.5, ["precip_accum"])
+    
+    assert results["precip_accum"] == {"value": 0.0, "status": "success", "layer": PR}
+    assert len(upstream.calls) == 1
@@ -0,0 +1,37 @@
+import app as weather_app
+from helpers import FakeResponse, named_features
+
+TT = weather_app.HRDPS_LAYERS["temperature"]
+
+
+def etag_handler(params, headers_seen):
+    """Serve 304 to a matching If-None-Match, otherwise a fresh body with an ETag."""
+    if headers_seen[-1].get("If-None-Match") == '"v1"':
+        return FakeResponse(304)
+    return FakeResponse(body=named_features({TT: -5.0}), headers={"ETag": '"v1"'})
+
+
+def test_nearby_point_revalidates_after_value_cache_expiry(upstream):
+    upstream.handler = lambda params: etag_handler(params, upstream.headers)
+    
+    first = weather_app.fetch_all_layers_wms(46.301, -79.501, ["temperature"])
+    weather_app._local_cache.clear()  # value cache expired
+    second = weather_app.fetch_all_layers_wms(46.304, -79.498, ["temperature"])
+    
+    assert upstream.headers[0] == {}
+    assert upstream.headers[1] == {"If-None-Match": '"v1"'}
+    assert first["temperature"]["value"] == second["temperature"]["value"] == -5.0
+
+
+def test_distant_point_is_not_revalidated(upstream):
+    upstream.handler = lambda params: etag_handler(params, upstream.headers)
+    
+    weather_app.fetch_all_layers_wms(46.3, -79.5, ["temperature"])
+    weather_app.fetch_all_layers_wms(46.5, -79.5, ["temperature"])
+    
+    assert upstream.headers == [{}, {}]
+
+
+def test_nearby_points_send_identical_bbox():
+    assert weather_app.wms_bbox(46.301, -79.501) == weather_app.wms_bbox(46.304, -79.498)
+    assert weather_app.wms_bbox(46.301, -79.501) != weather_app.wms_bbox(46.32, -79.5)
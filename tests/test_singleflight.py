@@ -0,0 +1,99 @@
+import threading
+import time
+
+import requests
+
+import app as weather_app
+from helpers import FakeResponse, named_features
+
+TT = weather_app.HRDPS_LAYERS["temperature"]
+
+
+def test_singleflight_coalesces_concurrent_calls():
+    calls = []
+    release = threading.Event()
+    
+    def slow_fetch():
+        calls.append(1)
+        release.wait(2)
+        return "value"
+    
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(weather_app.singleflight("k", slow_fetch)))
+        for _ in range(10)
+    ]
+    for t in threads:
+        t.start()
+    # Give every thread time to join the in-flight call before releasing it
+    time.sleep(0.2)
+    release.set()
+    for t in threads:
+        t.join()
+    
+    assert len(calls) == 1
+    assert results == ["value"] * 10
+    assert weather_app._inflight == {}
+
+
+def test_singleflight_shares_exceptions():
+    release = threading.Event()
+    errors = []
+    
+    def failing_fetch():
+        release.wait(2)
+        raise requests.exceptions.Timeout()
+    
+    def call():
+        try:
+            weather_app.singleflight("k", failing_fetch)
+        except requests.exceptions.Timeout:
+            errors.append(1)
+    
+    threads = [threading.Thread(target=call) for _ in range(5)]
+    for t in threads:
+        t.start()
+    time.sleep(0.2)
+    release.set()
+    for t in threads:
+        t.join()
+    
+    assert len(errors) == 5
+    assert weather_app._inflight == {}
+
+
+def test_single_layer_combined_fetch_does_not_collide_with_fallback(upstream):
+    # A single-layer combined request for TT is in flight while another
+    # request's per-layer fallback for TT starts - they must not share a result
+    combined_started = threading.Event()
+    release = threading.Event()
+    
+    def handler(params):
+        layers = params["LAYERS"].split(",")
+        if len(layers) > 1:
+            return FakeResponse(503)
+        combined_started.set()
+        release.wait(2)
+        return FakeResponse(body=named_features({TT: 1.5}))
+    
+    upstream.handler = handler
+    single = {}
+    thread = threading.Thread(target=lambda: single.update(
+        weather_app.fetch_all_layers_wms(46.3, -79.5, ["temperature"])
+    ))
+    thread.start()
+    assert combined_started.wait(2)
+    
+    pair = {}
+    pair_thread = threading.Thread(target=lambda: pair.update(
+        weather_app.fetch_all_layers_wms(46.3, -79.5, ["temperature", "wind_speed"])
+    ))
+    pair_thread.start()
+    time.sleep(0.2)
+    release.set()
+    thread.join()
+    pair_thread.join()
+    
+    assert single["temperature"]["status"] == "success"
+    assert pair["temperature"]["status"] == "success"
+    assert pair["temperature"]["value"] == 1.5
@@ -0,0 +1,28 @@
+import pytest
+
+import app as weather_app
+
+
+@pytest.mark.parametrize("query", [
+    "lat=nan&lon=-79.5",
+    "lat=46.3&lon=inf",
+    "lat=30&lon=-79.5",
+])
+def test_weather_rejects_bad_coordinates(query):
+    response = weather_app.app.test_client().get(f"/weather?{query}")
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("query", [
+    "max_wind_kts=nan",
+    "max_gust_kts=inf",
+    "min_temp_c=-inf",
+])
+def test_bvlos_assessment_rejects_non_finite_thresholds(upstream, query):
+    response = weather_app.app.test_client().get(
+        f"/bvlos-assessment?lat=46.3&lon=-79.5&{query}"
+    )
+    
+    assert response.status_code == 400
+    # Rejected before any upstream call is made
+    assert upstream.calls == []